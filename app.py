@@ -1,14 +1,68 @@
 import os
+import html
 import json
+import hashlib
+import asyncio
+import threading
+from types import MappingProxyType
+from collections.abc import Mapping
+from typing import Final
 import streamlit as st
 from google import genai
+from pydantic import BaseModel, ValidationError
+
+# Optional C-backed JSON parser for the fallback path; json is used when it
+# is not installed.
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 CONFIG_PATH = "config.json"
 TAB_NAMES = ["Summary", "Actions", "Decisions", "Risks"]
 
+# Persistent on-disk cache so summaries survive process restarts and are
+# shared across sessions. Optional: if diskcache is missing or the cache
+# directory is unusable, fall back to in-memory caching only.
+try:
+    import diskcache
+
+    CACHE = diskcache.Cache(".cache/minutes", size_limit=2**30)
+except Exception:
+    CACHE = None
+
+CACHE_EXPIRE_SECONDS = 7 * 86400
+
+# Semantic cache: reuse minutes for near-duplicate transcripts (whitespace,
+# speaker tags, trivial edits) that an exact hash would miss. Optional in the
+# same way as diskcache.
+try:
+    import faiss
+    import numpy as np
+except Exception:
+    faiss = None
+
+EMBEDDING_MODEL = "text-embedding-004"
+EMBEDDING_DIM = 768
+SEMANTIC_HIT_THRESHOLD = 0.97
+SEMANTIC_MAX_ENTRIES = 128
+
+GEMINI_MODEL = "gemini-2.5-flash"
+
+# Long transcripts are split into overlapping chunks summarized concurrently,
+# then merged. Roughly 4k tokens per chunk with a 200-token overlap, at the
+# usual ~4 characters per token.
+CHUNK_CHARS = 16000
+CHUNK_OVERLAP_CHARS = 800
+
 
+@st.cache_data(show_spinner=False)
 def load_api_key() -> str:
-    """Load Gemini API key from Streamlit secrets, env var, or config.json."""
+    """Load Gemini API key from Streamlit secrets, env var, or config.json.
+
+    Cached: the script reruns on every widget interaction and the key does
+    not change while the server is up.
+    """
     # 1) Try Streamlit secrets (catch if secrets.toml doesn't exist)
     try:
         api_key = st.secrets["GEMINI_API_KEY"]
@@ -37,14 +91,46 @@ def load_api_key() -> str:
     return ""
 
 
-def _blank_minutes():
-    return {
-        "summary": "",
-        "key_points": [],
-        "decisions": [],
-        "action_items": [],
-        "risks_open_questions": []
-    }
+# Read-only template for empty minutes. Streamlit reruns the whole script on
+# every widget interaction, so this is shared rather than rebuilt per run;
+# values are immutable, so a shallow dict() copy is enough where a mutable
+# dict is needed.
+_BLANK_MINUTES = MappingProxyType({
+    "summary": "",
+    "key_points": (),
+    "decisions": (),
+    "action_items": (),
+    "risks_open_questions": (),
+})
+
+
+class ActionItem(BaseModel):
+    owner: str = ""
+    task: str = ""
+    due: str = ""
+    priority: str = ""
+
+
+class Minutes(BaseModel):
+    """Structured-output schema passed to Gemini as response_schema, and used
+    to validate whatever text comes back."""
+
+    summary: str = ""
+    key_points: list[str] = []
+    decisions: list[str] = []
+    action_items: list[ActionItem] = []
+    risks_open_questions: list[str] = []
+
+
+class MalformedResponseError(ValueError):
+    """Raised when model output is not usable minutes JSON. Carries the raw
+    text so callers can surface it; raising instead of returning keeps bad
+    output out of every cache layer, so clicking Generate again retries the
+    API rather than re-serving the same bad response."""
+
+    def __init__(self, raw_text: str):
+        super().__init__("model returned malformed JSON")
+        self.raw_text = raw_text
 
 
 @st.cache_resource(show_spinner=False)
@@ -57,79 +143,413 @@ def get_genai_client(api_key: str):
     return genai.Client(api_key=api_key)
 
 
-def summarize_meeting(client: genai.Client, transcript: str) -> dict:
-    system_instruction = (
-        "You are an AI meeting assistant. Read the meeting transcript and "
-        "produce ONLY a JSON object with this schema:\n"
-        "{\n"
-        '  \"summary\": \"short paragraph\",\n'
-        '  \"key_points\": [\"point 1\", \"point 2\"],\n'
-        '  \"decisions\": [\"decision 1\", \"decision 2\"],\n'
-        '  \"action_items\": [\n'
-        '    {\n'
-        '      \"owner\": \"Name\",\n'
-        '      \"task\": \"what to do\",\n'
-        '      \"due\": \"deadline or empty string\",\n'
-        '      \"priority\": \"High | Medium | Low\"\n'
-        '    }\n'
-        "  ],\n"
-        '  \"risks_open_questions\": [\n'
-        '    \"risk or open question 1\",\n'
-        '    \"risk or open question 2\"\n'
-        "  ]\n"
-        "}\n"
-        "Rules:\n"
-        "1) Always return valid JSON.\n"
-        "2) Do not include any extra text before or after the JSON.\n"
-        "3) Infer reasonable owners, due dates (or \"\" if none), and priorities "
-        "for the action_items based on the transcript.\n"
-        "4) Include both risks and open questions together in 'risks_open_questions'."
+@st.cache_resource(show_spinner=False)
+def get_semantic_cache():
+    """Nearest-neighbour index over transcript embeddings, plus the raw
+    response text stored at the matching position. Shared across sessions,
+    so all access goes through the returned lock."""
+    if faiss is None:
+        return None
+    return faiss.IndexFlatIP(EMBEDDING_DIM), [], threading.Lock()
+
+
+def _embed_transcript(transcript: str):
+    """Return an L2-normalized embedding row vector, or None if the semantic
+    cache is unavailable or the embedding call fails."""
+    if get_semantic_cache() is None:
+        return None
+    try:
+        client = get_genai_client(load_api_key())
+        result = client.models.embed_content(
+            model=EMBEDDING_MODEL, contents=transcript
+        )
+        vec = np.asarray([result.embeddings[0].values], dtype=np.float32)
+        faiss.normalize_L2(vec)
+        return vec
+    except Exception:
+        return None  # embedding failures must never block generation
+
+
+def _semantic_lookup(vec) -> str | None:
+    """Return cached raw response text for the nearest transcript if its
+    cosine similarity clears SEMANTIC_HIT_THRESHOLD."""
+    cache = get_semantic_cache()
+    if cache is None or vec is None:
+        return None
+    index, responses, lock = cache
+    with lock:
+        if not index.ntotal:
+            return None
+        scores, ids = index.search(vec, 1)
+        if scores[0, 0] >= SEMANTIC_HIT_THRESHOLD:
+            return responses[ids[0, 0]]
+    return None
+
+
+def _semantic_store(vec, raw_text: str) -> None:
+    """Add a validated response to the semantic cache, evicting the oldest
+    entry once the cap is reached (IndexFlat.remove_ids keeps the remaining
+    vectors in insertion order, so positions stay aligned with responses)."""
+    cache = get_semantic_cache()
+    if cache is None or vec is None:
+        return
+    index, responses, lock = cache
+    with lock:
+        if index.ntotal >= SEMANTIC_MAX_ENTRIES:
+            index.remove_ids(np.arange(1, dtype=np.int64))
+            responses.pop(0)
+        index.add(vec)
+        responses.append(raw_text)
+
+
+SYSTEM_INSTRUCTION: Final[str] = (
+    "You are an AI meeting assistant. Read the meeting transcript and "
+    "produce ONLY a JSON object with this schema:\n"
+    "{\n"
+    '  \"summary\": \"short paragraph\",\n'
+    '  \"key_points\": [\"point 1\", \"point 2\"],\n'
+    '  \"decisions\": [\"decision 1\", \"decision 2\"],\n'
+    '  \"action_items\": [\n'
+    '    {\n'
+    '      \"owner\": \"Name\",\n'
+    '      \"task\": \"what to do\",\n'
+    '      \"due\": \"deadline or empty string\",\n'
+    '      \"priority\": \"High | Medium | Low\"\n'
+    '    }\n'
+    "  ],\n"
+    '  \"risks_open_questions\": [\n'
+    '    \"risk or open question 1\",\n'
+    '    \"risk or open question 2\"\n'
+    "  ]\n"
+    "}\n"
+    "Rules:\n"
+    "1) Always return valid JSON.\n"
+    "2) Do not include any extra text before or after the JSON.\n"
+    "3) Infer reasonable owners, due dates (or \"\" if none), and priorities "
+    "for the action_items based on the transcript.\n"
+    "4) Include both risks and open questions together in 'risks_open_questions'."
+)
+
+
+# Refresh the handle slightly before the server-side cache's 3600s TTL so a
+# stale name is never reused.
+@st.cache_resource(show_spinner=False, ttl=3000)
+def get_prompt_cache(api_key: str) -> str | None:
+    """Upload the static system instruction once via Gemini context caching
+    and return the cache handle. Returns None when the API rejects the
+    request (e.g. the instruction is below the model's minimum cacheable
+    token count), in which case callers resend the instruction inline."""
+    try:
+        client = get_genai_client(api_key)
+        cache = client.caches.create(
+            model=GEMINI_MODEL,
+            config=genai.types.CreateCachedContentConfig(
+                system_instruction=SYSTEM_INSTRUCTION,
+                ttl="3600s",
+            ),
+        )
+        return cache.name
+    except Exception:
+        return None
+
+
+def _minutes_request(text: str):
+    """Build (contents, config) for a minutes-generation call. When the
+    system instruction is available in Gemini's context cache, reference the
+    handle instead of resending the full instruction on every call."""
+    cached_content = get_prompt_cache(load_api_key())
+    config_kwargs = {
+        "response_mime_type": "application/json",
+        "response_schema": Minutes,
+    }
+    if cached_content:
+        config_kwargs["cached_content"] = cached_content
+        parts = [{"text": text}]
+    else:
+        parts = [{"text": SYSTEM_INSTRUCTION}, {"text": text}]
+    return (
+        [{"role": "user", "parts": parts}],
+        genai.types.GenerateContentConfig(**config_kwargs),
     )
 
-    response = client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=[
-            {
-                "role": "user",
-                "parts": [
-                    {"text": system_instruction},
-                    {"text": f"Meeting transcript:\n{transcript}"},
-                ],
-            },
-        ],
-        config=genai.types.GenerateContentConfig(
-            response_mime_type="application/json",
-        ),
+
+def _chunk_transcript(transcript: str) -> list[str]:
+    """Split a long transcript into overlapping chunks; short transcripts
+    come back as a single chunk."""
+    if len(transcript) <= CHUNK_CHARS:
+        return [transcript]
+    chunks = []
+    start = 0
+    step = CHUNK_CHARS - CHUNK_OVERLAP_CHARS
+    while start < len(transcript):
+        chunks.append(transcript[start:start + CHUNK_CHARS])
+        if start + CHUNK_CHARS >= len(transcript):
+            # The chunk just appended already reached the end; stepping again
+            # would emit a tail chunk contained entirely in this one.
+            break
+        start += step
+    return chunks
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=128)
+def _call_gemini(transcript_hash: str, transcript: str) -> str:
+    """Call Gemini for a transcript and return the raw JSON response text.
+
+    Cached in-process so a repeated transcript skips the network round-trip
+    entirely. The client is looked up inside rather than passed as a
+    parameter because ``genai.Client`` is not hashable by ``st.cache_data``.
+    A DiskCache layer underneath persists responses across restarts.
+    """
+    if CACHE is not None:
+        try:
+            cached = CACHE.get(transcript_hash)
+            if cached is not None:
+                return cached
+        except Exception:
+            pass  # a broken disk cache should never block generation
+
+    client = get_genai_client(load_api_key())
+    contents, config = _minutes_request(f"Meeting transcript:\n{transcript}")
+
+    # Stream so the first tokens show up after hundreds of milliseconds
+    # instead of the UI sitting on a spinner for the whole response. The
+    # interim view is cleared once the full JSON has arrived.
+    placeholder = st.empty()
+    buf = []
+    for chunk in client.models.generate_content_stream(
+        model=GEMINI_MODEL,
+        contents=contents,
+        config=config,
+    ):
+        if chunk.text:
+            buf.append(chunk.text)
+            placeholder.code("".join(buf), language="json")
+    placeholder.empty()
+
+    # Validate before returning: st.cache_data memoizes return values but
+    # not exceptions, so an empty or truncated stream is never cached and a
+    # second click retries the API.
+    raw_text = _check_minutes_text("".join(buf))
+    if CACHE is not None:
+        try:
+            CACHE.set(transcript_hash, raw_text, expire=CACHE_EXPIRE_SECONDS)
+        except Exception:
+            pass
+    return raw_text
+
+
+async def _acall_gemini_chunk(client: genai.Client, chunk: str) -> str:
+    """Summarize one transcript chunk, reusing the disk cache keyed by the
+    chunk's own hash so re-runs only re-issue changed chunks."""
+    chunk_hash = hashlib.sha256(chunk.encode()).hexdigest()
+    if CACHE is not None:
+        try:
+            cached = CACHE.get(chunk_hash)
+            if cached is not None:
+                return cached
+        except Exception:
+            pass
+
+    contents, config = _minutes_request(f"Meeting transcript:\n{chunk}")
+    response = await client.aio.models.generate_content(
+        model=GEMINI_MODEL,
+        contents=contents,
+        config=config,
+    )
+    # Validate before CACHE.set: the disk cache is shared across sessions
+    # and survives restarts, so one truncated response must not poison this
+    # chunk for a week.
+    raw_text = _check_minutes_text(response.text)
+    if CACHE is not None:
+        try:
+            CACHE.set(chunk_hash, raw_text, expire=CACHE_EXPIRE_SECONDS)
+        except Exception:
+            pass
+    return raw_text
+
+
+async def _summarize_chunks_async(client: genai.Client, chunks: list[str]) -> str:
+    """Map-reduce over a chunked transcript: summarize all chunks
+    concurrently, then issue one merge call over the partial JSON objects."""
+    partials = await asyncio.gather(
+        *(_acall_gemini_chunk(client, chunk) for chunk in chunks)
+    )
+    merge_input = (
+        "Below are partial meeting minutes as JSON objects, produced from "
+        "consecutive overlapping chunks of one meeting transcript. Merge "
+        "them into a single JSON object with the same schema, deduplicating "
+        "content repeated across chunk boundaries:\n" + "\n".join(partials)
+    )
+    contents, config = _minutes_request(merge_input)
+    response = await client.aio.models.generate_content(
+        model=GEMINI_MODEL,
+        contents=contents,
+        config=config,
     )
+    # Validated so the semantic cache never stores an unusable merge result.
+    return _check_minutes_text(response.text)
 
-    raw_text = response.text
+
+def _parse_minutes(raw_text: str) -> dict:
+    """Validate raw model output against the Minutes schema. Output that is
+    valid JSON but does not fit the schema goes through a plain
+    (orjson-accelerated) parse; anything else is surfaced as raw_response."""
+    try:
+        return Minutes.model_validate_json(raw_text).model_dump()
+    except ValidationError:
+        pass
     try:
-        parsed = json.loads(raw_text)
-        return {**_blank_minutes(), **parsed}
-    except json.JSONDecodeError:
+        parsed = (
+            orjson.loads(raw_text) if orjson is not None else json.loads(raw_text)
+        )
+    except ValueError:
         return {"raw_response": raw_text}
+    if isinstance(parsed, dict):
+        return {**_BLANK_MINUTES, **parsed}
+    return {"raw_response": raw_text}
+
+
+def _check_minutes_text(raw_text: str) -> str:
+    """Return raw_text unchanged if it parses as minutes; raise otherwise so
+    no cache layer ever stores unusable output."""
+    if "raw_response" in _parse_minutes(raw_text):
+        raise MalformedResponseError(raw_text)
+    return raw_text
+
+
+def summarize_meeting(transcript: str) -> dict:
+    transcript = transcript.strip()
+    transcript_hash = hashlib.sha256(transcript.encode()).hexdigest()
+
+    vec = _embed_transcript(transcript)
+    raw_text = _semantic_lookup(vec)
+    if raw_text is None:
+        chunks = _chunk_transcript(transcript)
+        try:
+            if len(chunks) == 1:
+                raw_text = _call_gemini(transcript_hash, transcript)
+            else:
+                client = get_genai_client(load_api_key())
+                raw_text = asyncio.run(_summarize_chunks_async(client, chunks))
+        except MalformedResponseError as exc:
+            return {"raw_response": exc.raw_text}
+        _semantic_store(vec, raw_text)
+
+    return _parse_minutes(raw_text)
+
+
+async def _asummarize_one(client: genai.Client, transcript: str) -> dict:
+    """Summarize one transcript on the async client (used for batch
+    uploads). Single-chunk transcripts share the disk-cache key of the
+    interactive path; long ones reuse the chunked map-reduce path."""
+    transcript = transcript.strip()
+    chunks = _chunk_transcript(transcript)
+    try:
+        if len(chunks) == 1:
+            raw_text = await _acall_gemini_chunk(client, transcript)
+        else:
+            raw_text = await _summarize_chunks_async(client, chunks)
+    except MalformedResponseError as exc:
+        return {"raw_response": exc.raw_text}
+    return _parse_minutes(raw_text)
+
+
+def summarize_batch(transcripts: list[str]) -> list[dict]:
+    """Summarize several transcripts concurrently; wall-clock time is
+    bounded by the slowest transcript rather than the sum of all of them."""
+    client = get_genai_client(load_api_key())
+
+    async def _run():
+        return await asyncio.gather(
+            *(_asummarize_one(client, transcript) for transcript in transcripts)
+        )
+
+    return asyncio.run(_run())
+
+
+def _escape_action_item(item: dict) -> dict:
+    return {k: html.escape(str(v)) for k, v in item.items()}
 
 
 def format_action_item(item: dict) -> str:
-    owner = item.get("owner", "Unassigned")
-    task = item.get("task", "Task not specified")
+    # `or` rather than a .get default: schema-validated items always carry
+    # the keys, just defaulted to "".
+    owner = item.get("owner") or "Unassigned"
+    task = item.get("task") or "Task not specified"
     due = item.get("due")
     priority = item.get("priority")
+    return " | ".join(
+        filter(
+            None,
+            (
+                f"**{owner}** — {task}",
+                f"**Due:** {due}" if due else "",
+                f"**Priority:** {priority}" if priority else "",
+            ),
+        )
+    )
 
-    parts = [f"**{owner}** — {task}"]
-    if due:
-        parts.append(f"**Due:** {due}")
-    if priority:
-        parts.append(f"**Priority:** {priority}")
-    return " | ".join(parts)
 
+_BULLET_LIST_OPEN = "<ul style='margin-top: 1em; color: #555;'>"
 
-# -------------------------- Streamlit UI --------------------------
 
-st.set_page_config(page_title="ClarifyMeet AI", page_icon="🗒️", layout="centered")
+def _render_bullets(items) -> str:
+    """Pre-render an escaped HTML bullet list, or '' when there is nothing
+    to show."""
+    if not items:
+        return ""
+    return (
+        _BULLET_LIST_OPEN
+        + "".join(f"<li>{html.escape(str(item))}</li>" for item in items)
+        + "</ul>"
+    )
 
-st.markdown(
-    """
+
+def _render_minutes_html(minutes) -> dict:
+    """Pre-render every tab's HTML once per generation. Tabs emit these
+    cached strings on each rerun instead of rebuilding and re-escaping the
+    markup, and user-derived content is escaped before going through
+    ``unsafe_allow_html``."""
+    summary_text = minutes.get("summary", "")
+    actions = minutes.get("action_items", ())
+    return {
+        "html_summary": (
+            f"<p style='color:#333;'>{html.escape(summary_text)}</p>"
+            if summary_text
+            else ""
+        ),
+        "html_key_points": _render_bullets(minutes.get("key_points", ())),
+        "html_actions": (
+            _BULLET_LIST_OPEN
+            + "".join(
+                "<li>{}</li>".format(format_action_item(_escape_action_item(item)))
+                for item in actions
+            )
+            + "</ul>"
+            if actions
+            else ""
+        ),
+        "html_decisions": _render_bullets(minutes.get("decisions", ())),
+        "html_risks": _render_bullets(minutes.get("risks_open_questions", ())),
+    }
+
+
+def _clear_screen() -> None:
+    """Reset all generated minutes state. Runs as the Clear button's
+    on_click callback, i.e. before the click's own render pass, so the
+    cleared UI appears without forcing an extra rerun."""
+    st.session_state.minutes = dict(_BLANK_MINUTES)
+    st.session_state.raw_json = ""
+    st.session_state.raw_response = ""
+    st.session_state.batch_results = ()
+    st.session_state.update(_render_minutes_html(_BLANK_MINUTES))
+
+
+@st.cache_data(show_spinner=False)
+def _css_block() -> str:
+    """Page styling, cached so the string is built once per server rather
+    than on every rerun."""
+    return """
     <style>
         .main {
             background-color: #fafbfc;
@@ -169,9 +589,14 @@ st.markdown(
             margin-top: 1rem;
         }
     </style>
-    """,
-    unsafe_allow_html=True,
-)
+    """
+
+
+# -------------------------- Streamlit UI --------------------------
+
+st.set_page_config(page_title="ClarifyMeet AI", page_icon="🗒️", layout="centered")
+
+st.markdown(_css_block(), unsafe_allow_html=True)
 
 st.markdown(
     "<h2 style='text-align: center; margin-bottom: 0.2em;'>ClarifyMeet AI</h2>",
@@ -182,8 +607,28 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-uploaded_file = st.file_uploader("Upload transcript file", type=["txt"], label_visibility="collapsed")
-default_text = uploaded_file.read().decode("utf-8") if uploaded_file else ""
+uploaded_files = st.file_uploader(
+    "Upload transcript files",
+    type=["txt"],
+    label_visibility="collapsed",
+    accept_multiple_files=True,
+)
+# Decode uploads once per file set rather than on every rerun; getvalue()
+# (unlike read()) does not consume the buffer, so a rerun can't see an
+# empty file.
+if uploaded_files:
+    _uploaded_ids = tuple(f.file_id for f in uploaded_files)
+    if st.session_state.get("_uploaded_ids") != _uploaded_ids:
+        st.session_state["_uploaded_texts"] = [
+            f.getvalue().decode("utf-8") for f in uploaded_files
+        ]
+        st.session_state["_uploaded_ids"] = _uploaded_ids
+    uploaded_texts = st.session_state["_uploaded_texts"]
+else:
+    uploaded_texts = []
+# A single upload prefills the text area; several uploads are summarized as
+# a batch and shown in per-file sections below.
+default_text = uploaded_texts[0] if len(uploaded_texts) == 1 else ""
 transcript = st.text_area(
     "Paste your meeting transcript here",
     value=default_text,
@@ -191,19 +636,48 @@ transcript = st.text_area(
     label_visibility="collapsed",
 )
 
-if "minutes" not in st.session_state:
-    st.session_state.minutes = _blank_minutes()
-if "raw_json" not in st.session_state:
-    st.session_state.raw_json = ""
-if "raw_response" not in st.session_state:
-    st.session_state.raw_response = ""
+for _key, _default in (
+    ("minutes", _BLANK_MINUTES),
+    ("raw_json", ""),
+    ("raw_response", ""),
+    ("html_summary", ""),
+    ("html_key_points", ""),
+    ("html_actions", ""),
+    ("html_decisions", ""),
+    ("html_risks", ""),
+    ("batch_results", ()),
+):
+    st.session_state.setdefault(
+        _key, dict(_default) if isinstance(_default, Mapping) else _default
+    )
 
 generate_clicked = st.button("Generate Minutes")
 
 api_key = load_api_key()
 
 if generate_clicked:
-    if not transcript.strip():
+    if len(uploaded_texts) > 1:
+        if not api_key:
+            st.error(
+                "No Gemini API key found. Provide it via config.json, the "
+                "environment, or Streamlit secrets."
+            )
+        else:
+            with st.spinner(f"Analyzing {len(uploaded_texts)} meetings..."):
+                try:
+                    results = summarize_batch(uploaded_texts)
+                    st.session_state.batch_results = [
+                        (
+                            f.name,
+                            _render_minutes_html(m),
+                            m.get("raw_response", ""),
+                        )
+                        for f, m in zip(uploaded_files, results)
+                    ]
+                    st.success(f"Minutes generated for {len(results)} transcripts!")
+                except Exception as exc:
+                    st.error(f"Failed to generate minutes: {exc}")
+    elif not transcript.strip():
         st.warning("Please provide a transcript before generating minutes.")
     elif not api_key:
         st.error(
@@ -213,8 +687,7 @@ if generate_clicked:
     else:
         with st.spinner("Analyzing meeting..."):
             try:
-                client = get_genai_client(api_key)
-                summary = summarize_meeting(client, transcript.strip())
+                summary = summarize_meeting(transcript.strip())
 
                 if "raw_response" in summary:
                     st.error("Model returned malformed JSON. See raw output below.")
@@ -226,6 +699,7 @@ if generate_clicked:
                         summary, indent=2, ensure_ascii=False
                     )
                     st.session_state.raw_response = ""
+                    st.session_state.update(_render_minutes_html(summary))
                     st.success("Minutes generated successfully!")
             except Exception as exc:
                 st.error(f"Failed to generate minutes: {exc}")
@@ -233,32 +707,19 @@ if generate_clicked:
 tabs = st.tabs(TAB_NAMES)
 
 with tabs[0]:
-    summary_text = st.session_state.minutes.get("summary", "")
-    key_points = st.session_state.minutes.get("key_points", [])
-    if summary_text:
-        st.markdown(f"<p style='color:#333;'>{summary_text}</p>", unsafe_allow_html=True)
-    if key_points:
-        st.markdown(
-            "<ul style='margin-top: 1em; color: #555;'>"
-            + "".join([f"<li>{point}</li>" for point in key_points])
-            + "</ul>",
-            unsafe_allow_html=True,
-        )
-    if not summary_text and not key_points:
+    if st.session_state.html_summary:
+        st.markdown(st.session_state.html_summary, unsafe_allow_html=True)
+    if st.session_state.html_key_points:
+        st.markdown(st.session_state.html_key_points, unsafe_allow_html=True)
+    if not st.session_state.html_summary and not st.session_state.html_key_points:
         st.markdown(
             "<div style='color: #bbb; margin-top: 1em;'>No data to display.</div>",
             unsafe_allow_html=True,
         )
 
 with tabs[1]:
-    actions = st.session_state.minutes.get("action_items", [])
-    if actions:
-        st.markdown(
-            "<ul style='margin-top: 1em; color: #555;'>"
-            + "".join([f"<li>{format_action_item(item)}</li>" for item in actions])
-            + "</ul>",
-            unsafe_allow_html=True,
-        )
+    if st.session_state.html_actions:
+        st.markdown(st.session_state.html_actions, unsafe_allow_html=True)
     else:
         st.markdown(
             "<div style='color: #bbb; margin-top: 1em;'>No action items to display.</div>",
@@ -266,14 +727,8 @@ with tabs[1]:
         )
 
 with tabs[2]:
-    decisions = st.session_state.minutes.get("decisions", [])
-    if decisions:
-        st.markdown(
-            "<ul style='margin-top: 1em; color: #555;'>"
-            + "".join([f"<li>{decision}</li>" for decision in decisions])
-            + "</ul>",
-            unsafe_allow_html=True,
-        )
+    if st.session_state.html_decisions:
+        st.markdown(st.session_state.html_decisions, unsafe_allow_html=True)
     else:
         st.markdown(
             "<div style='color: #bbb; margin-top: 1em;'>No decisions to display.</div>",
@@ -281,20 +736,37 @@ with tabs[2]:
         )
 
 with tabs[3]:
-    risks = st.session_state.minutes.get("risks_open_questions", [])
-    if risks:
-        st.markdown(
-            "<ul style='margin-top: 1em; color: #555;'>"
-            + "".join([f"<li>{risk}</li>" for risk in risks])
-            + "</ul>",
-            unsafe_allow_html=True,
-        )
+    if st.session_state.html_risks:
+        st.markdown(st.session_state.html_risks, unsafe_allow_html=True)
     else:
         st.markdown(
             "<div style='color: #bbb; margin-top: 1em;'>No risks or open questions to display.</div>",
             unsafe_allow_html=True,
         )
 
+if st.session_state.batch_results:
+    st.markdown(
+        "<div style='margin-top: 1em; font-weight: 600;'>Batch results</div>",
+        unsafe_allow_html=True,
+    )
+    for _name, _html_parts, _raw in st.session_state.batch_results:
+        with st.expander(_name):
+            if _raw:
+                st.error("Model returned malformed JSON. See raw output below.")
+                st.code(_raw, language="json")
+            else:
+                for _key, _heading in (
+                    ("html_summary", ""),
+                    ("html_key_points", "Key Points"),
+                    ("html_actions", "Action Items"),
+                    ("html_decisions", "Decisions"),
+                    ("html_risks", "Risks & Open Questions"),
+                ):
+                    if _html_parts[_key]:
+                        if _heading:
+                            st.markdown(f"**{_heading}**")
+                        st.markdown(_html_parts[_key], unsafe_allow_html=True)
+
 st.markdown('<div class="custom-btn-row">', unsafe_allow_html=True)
 copy_col, download_col, clear_col = st.columns(3)
 
@@ -308,21 +780,14 @@ with copy_col:
 with download_col:
     st.download_button(
         label="⬇️ Download JSON",
-        data=json.dumps(st.session_state.minutes, indent=2, ensure_ascii=False),
+        data=st.session_state.raw_json or "{}",
         file_name="minutes.json",
         mime="application/json",
-        disabled=(
-            not st.session_state.minutes.get("summary")
-            and not st.session_state.minutes.get("action_items")
-        ),
+        disabled=not st.session_state.raw_json,
     )
 
 with clear_col:
-    if st.button("🗑️ Clear Screen"):
-        st.session_state.minutes = _blank_minutes()
-        st.session_state.raw_json = ""
-        st.session_state.raw_response = ""
-        st.experimental_rerun()
+    st.button("🗑️ Clear Screen", on_click=_clear_screen)
 
 st.markdown('</div>', unsafe_allow_html=True)
 